@@ -131,7 +131,9 @@ func runParallel(numTrees int, configPath string, outputPath string, algoName st
 		})
 	}
 
-	for n := 1; n <= numTrees; n++ {
+	// Largest instances first: runtime grows with n, so starting the big ones
+	// early keeps the small ones for filling in at the end (LPT scheduling)
+	for n := numTrees; n >= 1; n-- {
 		jobs <- n
 	}
 	close(jobs)
@@ -280,8 +282,7 @@ func runAdvancedSA(numTrees int, configPath string, outputPath string, startingP
 			initialTrees, _ = greedy.InitializeTrees(n, nil)
 		}
 
-		bestTrees := sa.RunAdvancedSA(initialTrees, config)
-		return tree.CalculateScore(bestTrees), bestTrees
+		return sa.RunAdvancedSA(initialTrees, config)
 	})
 }
 
@@ -294,8 +295,7 @@ func runAdvancedSAPenalty(numTrees int, configPath string, outputPath string, st
 		} else {
 			initialTrees, _ = greedy.InitializeTrees(n, nil)
 		}
-		bestTrees := sa.RunAdvancedSAPenalty(initialTrees, config)
-		return tree.CalculateScore(bestTrees), bestTrees
+		return sa.RunAdvancedSAPenalty(initialTrees, config)
 	})
 }
 
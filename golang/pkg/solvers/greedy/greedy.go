@@ -12,11 +12,11 @@ import (
 )
 
 // GenerateWeightedAngle generates a random angle in DEGREES with distribution weighted by abs(sin(2*angle))
-func GenerateWeightedAngle() float64 {
+func GenerateWeightedAngle(rng *rand.Rand) float64 {
 	for {
-		angleDeg := rand.Float64() * 360.0
+		angleDeg := rng.Float64() * 360.0
 		angleRad := angleDeg * math.Pi / 180.0
-		if rand.Float64() < math.Abs(math.Sin(2*angleRad)) {
+		if rng.Float64() < math.Abs(math.Sin(2*angleRad)) {
 			return angleDeg
 		}
 	}
@@ -28,6 +28,10 @@ func InitializeTrees(numTrees int, existingTrees []tree.ChristmasTree) ([]tree.C
 		return []tree.ChristmasTree{}, 0
 	}
 
+	// Local generator: the global one is lock-protected and shared by all
+	// parallel workers. Seeding it from the global source keeps -seed effective.
+	rng := rand.New(rand.NewSource(rand.Int63()))
+
 	placedTrees := make([]tree.ChristmasTree, len(existingTrees))
 	copy(placedTrees, existingTrees)
 
@@ -42,7 +46,7 @@ func InitializeTrees(numTrees int, existingTrees []tree.ChristmasTree) ([]tree.C
 	if numToAdd > 0 {
 		// If starting from scratch, place first tree at origin
 		if len(placedTrees) == 0 {
-			t := tree.ChristmasTree{ID: 0, X: 0, Y: 0, Angle: rand.Float64() * 360.0}
+			t := tree.ChristmasTree{ID: 0, X: 0, Y: 0, Angle: rng.Float64() * 360.0}
 			placedTrees = append(placedTrees, t)
 			minX, minY, maxX, maxY := t.GetBoundingBox()
 			tr.Insert([2]float64{minX, minY}, [2]float64{maxX, maxY}, 0)
@@ -51,7 +55,7 @@ func InitializeTrees(numTrees int, existingTrees []tree.ChristmasTree) ([]tree.C
 
 		for i := 0; i < numToAdd; i++ {
 			newID := len(placedTrees)
-			treeToPlace := tree.ChristmasTree{ID: newID, Angle: rand.Float64() * 360.0}
+			treeToPlace := tree.ChristmasTree{ID: newID, Angle: rng.Float64() * 360.0}
 
 			var bestX, bestY float64
 			minRadius := math.Inf(1)
@@ -59,7 +63,7 @@ func InitializeTrees(numTrees int, existingTrees []tree.ChristmasTree) ([]tree.C
 
 			// Try 10 random starting attempts
 			for attempt := 0; attempt < 10; attempt++ {
-				angle := GenerateWeightedAngle()
+				angle := GenerateWeightedAngle(rng)
 				angleRad := angle * math.Pi / 180.0
 				vx := math.Cos(angleRad)
 				vy := math.Sin(angleRad)
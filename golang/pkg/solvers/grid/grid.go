@@ -52,6 +52,13 @@ func InitializeTrees(numTrees int, config *Config) ([]tree.ChristmasTree, float6
 
 	// Try different combinations of even/odd row tree counts
 	for nEven := 1; nEven <= numTrees; nEven++ {
+		// A layout is only accepted if every tree is placed, so its first row
+		// always holds nEven upright trees. That row's width bounds the side
+		// from below and grows with nEven, so no later layout can win.
+		if width := evenRowWidth(nEven, config); width*width >= bestScore {
+			break
+		}
+
 		for nOdd := nEven; nOdd >= nEven-1 && nOdd >= 0; nOdd-- {
 			trees := tryGridPlacement(numTrees, nEven, nOdd, config)
 
@@ -156,6 +163,13 @@ func tryGridPlacement(numTrees, nEven, nOdd int, config *Config) []tree.Christma
 	return allTrees
 }
 
+// evenRowWidth returns the width of a row of k upright (angle 0) trees
+func evenRowWidth(k int, config *Config) float64 {
+	minX := -tree.BaseW / 2
+	maxX := tree.BaseW/2 + float64(k-1)*config.HorizontalSpacing
+	return maxX - minX
+}
+
 // calculateGridScore calculates the score for a grid placement (max side squared)
 func calculateGridScore(trees []tree.ChristmasTree) float64 {
 	if len(trees) == 0 {
@@ -39,11 +39,13 @@ const (
 
 // FindBestGridGASolution runs the Genetic Algorithm to optimize block parameters
 func FindBestGridGASolution(numTrees int) (float64, []tree.ChristmasTree) {
-	rand.Seed(time.Now().UnixNano())
+	// Local generator rather than reseeding the shared global one, which every
+	// parallel worker would otherwise contend on (and clobber -seed with)
+	rng := rand.New(rand.NewSource(time.Now().UnixNano()))
 	fmt.Printf("Running Block-Based Grid GA Solver for N=%d...\n", numTrees)
 
 	// Initialize Population
-	pop := initPopulation()
+	pop := initPopulation(rng)
 
 	var bestInd GridIndividual
 	bestInd.Score = math.MaxFloat64
@@ -66,16 +68,16 @@ func FindBestGridGASolution(numTrees int) (float64, []tree.ChristmasTree) {
 		newPop = append(newPop, bestInd)
 
 		for len(newPop) < PopulationSize {
-			p1 := tournamentSelection(pop)
-			p2 := tournamentSelection(pop)
+			p1 := tournamentSelection(pop, rng)
+			p2 := tournamentSelection(pop, rng)
 
 			child := p1 // Default clone
-			if rand.Float64() < CrossoverRate {
-				child = crossover(p1, p2)
+			if rng.Float64() < CrossoverRate {
+				child = crossover(p1, p2, rng)
 			}
 
-			if rand.Float64() < MutationRate {
-				mutate(&child)
+			if rng.Float64() < MutationRate {
+				mutate(&child, rng)
 			}
 			newPop = append(newPop, child)
 		}
@@ -86,15 +88,15 @@ func FindBestGridGASolution(numTrees int) (float64, []tree.ChristmasTree) {
 }
 
 // FIXME: unused n param?
-func initPopulation() []GridIndividual {
+func initPopulation(rng *rand.Rand) []GridIndividual {
 	pop := make([]GridIndividual, PopulationSize)
 	for i := range pop {
 		// Heuristic initialization for angles and offsets
 		// Start from a known good configuration and add variance
 		pop[i] = GridIndividual{
-			Angle: 60.0 + (rand.Float64()-0.5)*40.0, // 40-80 degrees
-			Dx:    -0.6 + (rand.Float64()-0.5)*0.4,  // -0.8 to -0.4
-			Dy:    -0.1 + (rand.Float64()-0.5)*0.4,  // -0.3 to 0.1
+			Angle: 60.0 + (rng.Float64()-0.5)*40.0, // 40-80 degrees
+			Dx:    -0.6 + (rng.Float64()-0.5)*0.4,  // -0.8 to -0.4
+			Dy:    -0.1 + (rng.Float64()-0.5)*0.4,  // -0.3 to 0.1
 		}
 	}
 	return pop
@@ -479,10 +481,10 @@ func checkTreeCollisionRTree(t tree.ChristmasTree, existing []tree.ChristmasTree
 	return collision
 }
 
-func tournamentSelection(pop []GridIndividual) GridIndividual {
-	best := pop[rand.Intn(len(pop))]
+func tournamentSelection(pop []GridIndividual, rng *rand.Rand) GridIndividual {
+	best := pop[rng.Intn(len(pop))]
 	for i := 0; i < TournamentSize-1; i++ {
-		challenger := pop[rand.Intn(len(pop))]
+		challenger := pop[rng.Intn(len(pop))]
 		if challenger.Score < best.Score {
 			best = challenger
 		}
@@ -490,9 +492,9 @@ func tournamentSelection(pop []GridIndividual) GridIndividual {
 	return best
 }
 
-func crossover(p1, p2 GridIndividual) GridIndividual {
+func crossover(p1, p2 GridIndividual, rng *rand.Rand) GridIndividual {
 	// Arithmetic crossover for all parameters
-	alpha := rand.Float64()
+	alpha := rng.Float64()
 
 	return GridIndividual{
 		Angle: p1.Angle*alpha + p2.Angle*(1-alpha),
@@ -501,10 +503,10 @@ func crossover(p1, p2 GridIndividual) GridIndividual {
 	}
 }
 
-func mutate(ind *GridIndividual) {
+func mutate(ind *GridIndividual, rng *rand.Rand) {
 	// Mutate each gene with some probability
-	if rand.Float64() < 0.5 {
-		ind.Angle += rand.NormFloat64() * 10.0
+	if rng.Float64() < 0.5 {
+		ind.Angle += rng.NormFloat64() * 10.0
 		// Keep angle in reasonable range [0, 360)
 		if ind.Angle < 0 {
 			ind.Angle += 360.0
@@ -512,10 +514,10 @@ func mutate(ind *GridIndividual) {
 			ind.Angle -= 360.0
 		}
 	}
-	if rand.Float64() < 0.5 {
-		ind.Dx += rand.NormFloat64() * 0.2
+	if rng.Float64() < 0.5 {
+		ind.Dx += rng.NormFloat64() * 0.2
 	}
-	if rand.Float64() < 0.5 {
-		ind.Dy += rand.NormFloat64() * 0.2
+	if rng.Float64() < 0.5 {
+		ind.Dy += rng.NormFloat64() * 0.2
 	}
 }
@@ -0,0 +1,37 @@
+package grid
+
+import (
+	"math"
+	"testing"
+)
+
+// unprunedScore sweeps every even/odd row combination without the early exit
+func unprunedScore(numTrees int, config *Config) float64 {
+	bestScore := math.MaxFloat64
+	for nEven := 1; nEven <= numTrees; nEven++ {
+		for nOdd := nEven; nOdd >= nEven-1 && nOdd >= 0; nOdd-- {
+			trees := tryGridPlacement(numTrees, nEven, nOdd, config)
+			if len(trees) != numTrees {
+				continue
+			}
+			if score := calculateGridScore(trees); score < bestScore {
+				bestScore = score
+			}
+		}
+	}
+	return bestScore
+}
+
+func TestInitializeTreesPruningIsExact(t *testing.T) {
+	config := DefaultConfig()
+	for n := 1; n <= 60; n++ {
+		trees, score := InitializeTrees(n, config)
+
+		if len(trees) != n {
+			t.Fatalf("n=%d: expected %d trees, got %d", n, n, len(trees))
+		}
+		if want := unprunedScore(n, config); score != want {
+			t.Errorf("n=%d: pruned score %f, full sweep %f", n, score, want)
+		}
+	}
+}
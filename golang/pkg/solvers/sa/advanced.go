@@ -1,6 +1,7 @@
 package sa
 
 import (
+	"fmt"
 	"math"
 	"math/rand"
 
@@ -230,12 +231,14 @@ func PerturbAdvanced(trees []tree.ChristmasTree, str float64, rng *rand.Rand) []
 	return c
 }
 
-// RunAdvancedSA runs the advanced Simulated Annealing optimization
-func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.ChristmasTree {
+// RunAdvancedSA runs the advanced Simulated Annealing optimization and returns
+// the best side length found along with its trees
+func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) (float64, []tree.ChristmasTree) {
 	rng := rand.New(rand.NewSource(config.RandomSeed))
 	c := CloneTrees(initialTrees)
 	best := CloneTrees(c)
 	cur := CloneTrees(c)
+	savedCur := make([]tree.ChristmasTree, len(cur)) // Reused backup buffer, refreshed with copy
 
 	bs := tree.Side(best)
 	cs := bs
@@ -244,7 +247,7 @@ func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.Chr
 
 	n := len(c)
 	if n == 0 {
-		return c
+		return 0, c
 	}
 
 	iter := config.NSteps * config.NStepsPerT
@@ -252,11 +255,15 @@ func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.Chr
 	// Track total steps for cooling schedule
 	step := 0
 	for it := 0; it < iter; it++ {
+		if config.StagnationLimit > 0 && noImp >= config.StagnationLimit {
+			fmt.Printf("[n=%3d] No improvement in %d steps, stopping early\n", n, noImp)
+			break
+		}
 		step++
 		mt := rng.Intn(11) // 0-10 move types
 		sc := T / config.Tmax
 		valid := true
-		savedCur := CloneTrees(cur) // Save state before mutation
+		copy(savedCur, cur) // Save state before mutation
 
 		// Select move type
 		switch mt {
@@ -384,7 +391,7 @@ func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.Chr
 		}
 
 		if !valid {
-			cur = savedCur // Revert
+			copy(cur, savedCur) // Revert
 			noImp++
 
 			// Cool temperature if step reached
@@ -403,13 +410,13 @@ func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.Chr
 			cs = ns
 			if ns < bs {
 				bs = ns
-				best = CloneTrees(cur)
+				copy(best, cur)
 				noImp = 0
 			} else {
 				noImp++
 			}
 		} else {
-			cur = CloneTrees(best) // Reset to best
+			copy(cur, best) // Reset to best
 			cs = bs
 			noImp++
 		}
@@ -421,5 +428,5 @@ func RunAdvancedSA(initialTrees []tree.ChristmasTree, config *Config) []tree.Chr
 		}
 	}
 
-	return best
+	return bs, best
 }
@@ -11,7 +11,8 @@ import (
 
 // RunAdvancedSAPenalty runs the advanced Simulated Annealing optimization with penalty scoring.
 // It allows overlaps but penalizes them, enabling traversal through invalid states.
-func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []tree.ChristmasTree {
+// Returns the best valid side length found along with its trees.
+func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) (float64, []tree.ChristmasTree) {
 	startTime := time.Now()
 	rng := rand.New(rand.NewSource(config.RandomSeed))
 
@@ -28,6 +29,7 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 	// Initialize with input if valid, otherwise keep best found so far
 	bestValidTrees := CloneTrees(cur)
 	bestValidScore := math.MaxFloat64
+	backup := make([]tree.ChristmasTree, n) // Full-slice undo buffer for global moves
 
 	if curOverlap == 0 {
 		bestValidScore = curBBox
@@ -36,12 +38,15 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 	iter := config.NSteps * config.NStepsPerT
 	T := config.Tmax
 
+	stale := 0 // Steps since the last new best valid solution
+
 	// Helper to update best valid
 	updateBest := func() {
 		if curOverlap < 1e-9 { // Float tolerance for zero overlap
 			if curBBox < bestValidScore {
 				bestValidScore = curBBox
-				bestValidTrees = CloneTrees(cur)
+				copy(bestValidTrees, cur)
+				stale = 0
 				fmt.Printf("[AdvPenalty] [n=%d] NEW BEST VALID: %.5f\n", n, bestValidScore)
 			}
 		}
@@ -50,6 +55,12 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 	updateBest()
 
 	for it := 0; it < iter; it++ {
+		if config.StagnationLimit > 0 && stale >= config.StagnationLimit {
+			fmt.Printf("[AdvPenalty] [n=%d] No improvement in %d steps, stopping early\n", n, stale)
+			break
+		}
+		stale++
+
 		mt := rng.Intn(11) // 0-10 move types
 		sc := T / config.Tmax
 		if sc > 1 {
@@ -130,7 +141,7 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 			}
 		// TODO: not fully implemented
 		case 5: // Squeeze (global)
-			savedCur := CloneTrees(cur)
+			copy(backup, cur)
 			factor := 1.0 - rng.Float64()*0.004*sc
 			gx0, gy0, gx1, gy1 := tree.GetBounds(cur)
 			cx := (gx0 + gx1) / 2.0
@@ -140,8 +151,8 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 				cur[i].Y = cy + (cur[i].Y-cy)*factor
 			}
 
-			undoTrees = savedCur // using this as full backup
-			undoIdx = nil        // nil implies full restore
+			undoTrees = backup // using this as full backup
+			undoIdx = nil      // nil implies full restore
 
 		case 6: // Levy flight
 			i := rng.Intn(n)
@@ -221,7 +232,7 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 				}
 			} else if len(undoTrees) > 0 {
 				// Global revert
-				cur = undoTrees // Restore full slice
+				copy(cur, undoTrees) // Restore full slice
 			}
 		}
 
@@ -239,5 +250,9 @@ func RunAdvancedSAPenalty(initialTrees []tree.ChristmasTree, config *Config) []t
 		}
 	}
 
-	return bestValidTrees
+	// No valid solution was found; score the fallback (the initial trees)
+	if bestValidScore == math.MaxFloat64 {
+		bestValidScore = tree.CalculateSideLength(bestValidTrees)
+	}
+	return bestValidScore, bestValidTrees
 }
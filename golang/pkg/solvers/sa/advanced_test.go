@@ -63,7 +63,7 @@ func TestRunAdvancedSA(t *testing.T) {
 		NStepsPerT: 5,
 		Cooling:    CoolingExponential,
 	}
-	result := RunAdvancedSA(trees, conf)
+	_, result := RunAdvancedSA(trees, conf)
 
 	if len(result) != len(trees) {
 		t.Errorf("Expected %d trees, got %d", len(trees), len(result))
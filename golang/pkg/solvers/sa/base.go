@@ -64,7 +64,8 @@ func (sa *Base) CoolTemperature(T float64, step int) float64 {
 func GetNextTemperature(config *Config, T float64, step int) float64 {
 	switch config.Cooling {
 	case CoolingLinear:
-		return T - (config.Tmax-config.Tmin)/float64(config.NSteps)
+		// Closed form in step, like the other schedules, so no rounding accumulates
+		return config.Tmax - (config.Tmax-config.Tmin)*float64(step+1)/float64(config.NSteps)
 	case CoolingExponential:
 		Tfactor := -math.Log(config.Tmax / config.Tmin)
 		return config.Tmax * math.Exp(Tfactor*float64(step+1)/float64(config.NSteps))
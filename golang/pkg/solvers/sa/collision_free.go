@@ -31,8 +31,19 @@ func (sa *SimulatedAnnealing) Solve() (float64, []tree.ChristmasTree) {
 	bestScore := currentScore
 	bestTrees := CloneTrees(currentTrees)
 
+	// Spatial index over currentTrees, updated only when a move is accepted
+	index := tree.NewIndex(currentTrees)
+	stale := 0 // Steps since the last new best
+
+schedule:
 	for step := 0; step < sa.Config.NSteps; step++ {
 		for step1 := 0; step1 < sa.Config.NStepsPerT; step1++ {
+			if sa.Config.StagnationLimit > 0 && stale >= sa.Config.StagnationLimit {
+				fmt.Printf("[n=%3d] No improvement in %d steps, stopping early\n", len(currentTrees), stale)
+				break schedule
+			}
+			stale++
+
 			// Select random tree to perturb
 			i := sa.Rng.Intn(len(currentTrees))
 			oldX, oldY, oldAngle := sa.PerturbTree(&currentTrees[i])
@@ -44,20 +55,24 @@ func (sa *SimulatedAnnealing) Solve() (float64, []tree.ChristmasTree) {
 				fmt.Printf("[Trees: %d]T: %.3f  Step: %6d  Score: %8.5f  Best: %8.5f  Time: %s\n",
 					len(currentTrees), T, currentStep, currentScore, bestScore, elapsed)
 			}
-			if tree.HasCollision(currentTrees) {
+			// Only tree i moved, so only its pairs can have started colliding
+			if index.Collides(currentTrees, i) {
 				sa.RestoreTree(&currentTrees[i], oldX, oldY, oldAngle)
 				continue
 			}
 
-			newScore := tree.CalculateScore(currentTrees)
+			// Score from the indexed bounds, rebuilding only the moved tree
+			newScore := index.Side(currentTrees, i)
 			delta := newScore - currentScore
 
 			// Accept if better or with probability exp(-delta/T)
 			if delta < 0 || sa.Rng.Float64() < math.Exp(-delta/T) {
 				currentScore = newScore
+				index.Update(currentTrees, i)
 				if newScore < bestScore {
 					bestScore = newScore
-					bestTrees = CloneTrees(currentTrees)
+					copy(bestTrees, currentTrees)
+					stale = 0
 					fmt.Printf("[n=%3d] NEW BEST SCORE: %8.5f\n", len(currentTrees), bestScore)
 				}
 			} else {
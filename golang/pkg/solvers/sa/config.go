@@ -18,18 +18,19 @@ const (
 
 // Config holds configuration parameters for simulated annealing
 type Config struct {
-	Tmax           float64         `yaml:"Tmax"`
-	Tmin           float64         `yaml:"Tmin"`
-	NSteps         int             `yaml:"nsteps"`
-	NStepsPerT     int             `yaml:"nsteps_per_T"`
-	Cooling        CoolingSchedule `yaml:"cooling"`
-	Alpha          float64         `yaml:"alpha"`
-	N              float64         `yaml:"n"` // Polynomial exponent
-	PositionDelta  float64         `yaml:"position_delta"`
-	AngleDelta     float64         `yaml:"angle_delta"`
-	RandomSeed     int64           `yaml:"random_state"`
-	LogFreq        int             `yaml:"log_freq"`
-	OverlapPenalty float64         `yaml:"overlap_penalty"` // λ multiplier for penalty-based SA
+	Tmax            float64         `yaml:"Tmax"`
+	Tmin            float64         `yaml:"Tmin"`
+	NSteps          int             `yaml:"nsteps"`
+	NStepsPerT      int             `yaml:"nsteps_per_T"`
+	Cooling         CoolingSchedule `yaml:"cooling"`
+	Alpha           float64         `yaml:"alpha"`
+	N               float64         `yaml:"n"` // Polynomial exponent
+	PositionDelta   float64         `yaml:"position_delta"`
+	AngleDelta      float64         `yaml:"angle_delta"`
+	RandomSeed      int64           `yaml:"random_state"`
+	LogFreq         int             `yaml:"log_freq"`
+	OverlapPenalty  float64         `yaml:"overlap_penalty"`  // λ multiplier for penalty-based SA
+	StagnationLimit int             `yaml:"stagnation_limit"` // Stop after this many steps without a new best (0 = never)
 }
 
 // LoadConfig loads SA configuration from a YAML file
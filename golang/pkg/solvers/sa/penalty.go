@@ -42,9 +42,17 @@ func (sa *SimulatedAnnealingPenalty) SolvePenalty() (float64, []tree.ChristmasTr
 	if currentOverlap == 0 {
 		bestScore = currentBBox
 	}
+	stale := 0 // Steps since the last new best valid solution
 
+schedule:
 	for step := 0; step < sa.Config.NSteps; step++ {
 		for step1 := 0; step1 < sa.Config.NStepsPerT; step1++ {
+			if sa.Config.StagnationLimit > 0 && stale >= sa.Config.StagnationLimit {
+				fmt.Printf("[n=%3d] No improvement in %d steps, stopping early\n", len(currentTrees), stale)
+				break schedule
+			}
+			stale++
+
 			// Select random tree to perturb
 			i := sa.Rng.Intn(len(currentTrees))
 
@@ -76,7 +84,8 @@ func (sa *SimulatedAnnealingPenalty) SolvePenalty() (float64, []tree.ChristmasTr
 				if newOverlap == 0 && newBBox < bestBBoxScore {
 					bestBBoxScore = newBBox
 					bestScore = newBBox
-					bestTrees = CloneTrees(currentTrees)
+					copy(bestTrees, currentTrees)
+					stale = 0
 					fmt.Printf("[n=%3d] NEW BEST SCORE (valid): %8.5f\n", len(currentTrees), bestBBoxScore)
 				}
 			} else {
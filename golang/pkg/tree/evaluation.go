@@ -6,45 +6,6 @@ import (
 	"github.com/tidwall/rtree"
 )
 
-// HasCollision checks if any trees in the list collide with each other
-func HasCollision(trees []ChristmasTree) bool {
-	if len(trees) < 2 {
-		return false
-	}
-
-	// Build spatial index
-	tr := rtree.RTree{}
-	for i := range trees {
-		minX, minY, maxX, maxY := trees[i].GetBoundingBox()
-		tr.Insert([2]float64{minX, minY}, [2]float64{maxX, maxY}, i)
-	}
-
-	// Check each tree against potential collisions
-	for i := range trees {
-		minX, minY, maxX, maxY := trees[i].GetBoundingBox()
-
-		collision := false
-		tr.Search(
-			[2]float64{minX, minY},
-			[2]float64{maxX, maxY},
-			func(min, max [2]float64, data interface{}) bool {
-				j := data.(int)
-				if i != j && trees[i].Intersect(&trees[j]) {
-					collision = true
-					return false // Stop searching
-				}
-				return true
-			},
-		)
-
-		if collision {
-			return true
-		}
-	}
-
-	return false
-}
-
 // CalculateSideLength calculates the bounding box side length for a list of trees
 func CalculateSideLength(trees []ChristmasTree) float64 {
 	if len(trees) == 0 {
@@ -14,10 +14,42 @@ func deg2rad(deg float64) float64 {
 
 // GetBoundingBox returns the axis-aligned bounding box of the rotated tree
 func (t *ChristmasTree) GetBoundingBox() (float64, float64, float64, float64) {
-	// Calculate bounding box from the actual orb polygon (same as used for intersection)
-	poly := t.GetOrbPolygon()
-	ring := poly[0]
+	// Same transform as GetOrbPolygon (used for intersection), without building the ring
+	cosAngle, sinAngle := t.rotation()
+	minX, minY := math.MaxFloat64, math.MaxFloat64
+	maxX, maxY := -math.MaxFloat64, -math.MaxFloat64
+
+	for _, pt := range outline {
+		x := t.X + pt[0]*cosAngle - pt[1]*sinAngle
+		y := t.Y + pt[0]*sinAngle + pt[1]*cosAngle
+		if x < minX {
+			minX = x
+		}
+		if x > maxX {
+			maxX = x
+		}
+		if y < minY {
+			minY = y
+		}
+		if y > maxY {
+			maxY = y
+		}
+	}
+
+	return minX, minY, maxX, maxY
+}
 
+// rotation returns the cosine and sine of the tree's rotation angle
+func (t *ChristmasTree) rotation() (float64, float64) {
+	if t.Angle == 0 {
+		return 1, 0
+	}
+	angleRad := deg2rad(t.Angle)
+	return math.Cos(angleRad), math.Sin(angleRad)
+}
+
+// ringBounds returns the axis-aligned bounding box of a polygon ring
+func ringBounds(ring orb.Ring) (float64, float64, float64, float64) {
 	minX, minY := math.MaxFloat64, math.MaxFloat64
 	maxX, maxY := -math.MaxFloat64, -math.MaxFloat64
 
@@ -39,58 +71,48 @@ func (t *ChristmasTree) GetBoundingBox() (float64, float64, float64, float64) {
 	return minX, minY, maxX, maxY
 }
 
-// GetOrbPolygon returns an orb.Polygon representing the tree outline
-func (t *ChristmasTree) GetOrbPolygon() orb.Polygon {
+// outline is the unrotated tree outline centred on the trunk top. It is built
+// once and transformed by GetOrbPolygon rather than rebuilt on every call.
+var outline = orb.Ring{
 	// Create the outer ring of the polygon (COUNTER-CLOCKWISE for polygol)
 	// CCW order: tip -> left side down -> trunk -> right side up -> tip
-	ring := orb.Ring{
-		// Start at Tip
-		orb.Point{0.0, TipY},
-		// Left side - Top Tier (going down left = CCW)
-		orb.Point{-TopW / 2, Tier1Y},
-		orb.Point{-TopW / 4, Tier1Y},
-		// Left side - Middle Tier
-		orb.Point{-MidW / 2, Tier2Y},
-		orb.Point{-MidW / 4, Tier2Y},
-		// Left side - Bottom Tier
-		orb.Point{-BaseW / 2, BaseY},
-		// Left Trunk
-		orb.Point{-TrunkW / 2, BaseY},
-		orb.Point{-TrunkW / 2, TrunkBottomY},
-		// Right Trunk
-		orb.Point{TrunkW / 2, TrunkBottomY},
-		orb.Point{TrunkW / 2, BaseY},
-		// Right side - Bottom Tier
-		orb.Point{BaseW / 2, BaseY},
-		// Right side - Middle Tier
-		orb.Point{MidW / 4, Tier2Y},
-		orb.Point{MidW / 2, Tier2Y},
-		// Right side - Top Tier
-		orb.Point{TopW / 4, Tier1Y},
-		orb.Point{TopW / 2, Tier1Y},
-		// Close the ring back to the tip
-		orb.Point{0.0, TipY},
-	}
+	// Start at Tip
+	orb.Point{0.0, TipY},
+	// Left side - Top Tier (going down left = CCW)
+	orb.Point{-TopW / 2, Tier1Y},
+	orb.Point{-TopW / 4, Tier1Y},
+	// Left side - Middle Tier
+	orb.Point{-MidW / 2, Tier2Y},
+	orb.Point{-MidW / 4, Tier2Y},
+	// Left side - Bottom Tier
+	orb.Point{-BaseW / 2, BaseY},
+	// Left Trunk
+	orb.Point{-TrunkW / 2, BaseY},
+	orb.Point{-TrunkW / 2, TrunkBottomY},
+	// Right Trunk
+	orb.Point{TrunkW / 2, TrunkBottomY},
+	orb.Point{TrunkW / 2, BaseY},
+	// Right side - Bottom Tier
+	orb.Point{BaseW / 2, BaseY},
+	// Right side - Middle Tier
+	orb.Point{MidW / 4, Tier2Y},
+	orb.Point{MidW / 2, Tier2Y},
+	// Right side - Top Tier
+	orb.Point{TopW / 4, Tier1Y},
+	orb.Point{TopW / 2, Tier1Y},
+	// Close the ring back to the tip
+	orb.Point{0.0, TipY},
+}
 
-	// Apply translation to tree position
-	for i := range ring {
-		ring[i][0] += t.X
-		ring[i][1] += t.Y
-	}
+// GetOrbPolygon returns an orb.Polygon representing the tree outline
+func (t *ChristmasTree) GetOrbPolygon() orb.Polygon {
+	cosAngle, sinAngle := t.rotation()
 
-	// Apply rotation if needed
-	if t.Angle != 0 {
-		angleRad := deg2rad(t.Angle)
-		cosAngle := math.Cos(angleRad)
-		sinAngle := math.Sin(angleRad)
-
-		for i := range ring {
-			// Rotate around tree center (t.X, t.Y)
-			x := ring[i][0] - t.X
-			y := ring[i][1] - t.Y
-			ring[i][0] = t.X + x*cosAngle - y*sinAngle
-			ring[i][1] = t.Y + x*sinAngle + y*cosAngle
-		}
+	// Rotate around the tree center and translate to (t.X, t.Y) in one pass
+	ring := make(orb.Ring, len(outline))
+	for i, pt := range outline {
+		ring[i][0] = t.X + pt[0]*cosAngle - pt[1]*sinAngle
+		ring[i][1] = t.Y + pt[0]*sinAngle + pt[1]*cosAngle
 	}
 
 	return orb.Polygon{ring}
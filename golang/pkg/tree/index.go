@@ -0,0 +1,135 @@
+package tree
+
+import (
+	"math"
+
+	"github.com/engelsjk/polygol"
+	"github.com/tidwall/rtree"
+)
+
+// Index is an R-tree over tree bounding boxes that is kept up to date as
+// individual trees move, so collision queries don't rebuild it every step.
+// It also caches each indexed tree's polygon in polygol format, since the
+// trees that aren't moving are queried over and over, and the envelope of all
+// boxes so a move can be scored without rescanning every tree.
+type Index struct {
+	tr     rtree.RTree
+	bounds [][4]float64   // Indexed bounding box of each tree (minX, minY, maxX, maxY)
+	geoms  []polygol.Geom // Indexed polygon of each tree
+	env    [4]float64     // Envelope of all indexed bounding boxes
+}
+
+// NewIndex builds an index over trees; entry i refers to trees[i]
+func NewIndex(trees []ChristmasTree) *Index {
+	ix := &Index{
+		bounds: make([][4]float64, len(trees)),
+		geoms:  make([]polygol.Geom, len(trees)),
+	}
+	for i := range trees {
+		ix.insert(trees, i)
+	}
+	ix.env = ix.envelope(-1)
+	return ix
+}
+
+// insert adds the current bounding box and polygon of trees[i] to the index
+func (ix *Index) insert(trees []ChristmasTree, i int) {
+	poly := trees[i].GetOrbPolygon()
+	minX, minY, maxX, maxY := ringBounds(poly[0])
+	ix.bounds[i] = [4]float64{minX, minY, maxX, maxY}
+	ix.geoms[i] = orbPolygonToGeom(poly)
+	ix.tr.Insert([2]float64{minX, minY}, [2]float64{maxX, maxY}, i)
+}
+
+// Update re-indexes trees[i] after it has moved
+func (ix *Index) Update(trees []ChristmasTree, i int) {
+	b := ix.bounds[i]
+	ix.tr.Delete([2]float64{b[0], b[1]}, [2]float64{b[2], b[3]}, i)
+	wasOnEnvelope := ix.onEnvelope(i)
+	ix.insert(trees, i)
+
+	// The envelope can only shrink if the old box was part of it
+	if wasOnEnvelope {
+		ix.env = ix.envelope(-1)
+	} else {
+		ix.env = extendBounds(ix.env, ix.bounds[i])
+	}
+}
+
+// Side returns the bounding square side length of trees, as CalculateSideLength
+// would, with trees[i] at its current position. trees[i] may have moved since
+// it was last indexed; the other trees' bounds are taken from the index, so no
+// other polygons are rebuilt.
+func (ix *Index) Side(trees []ChristmasTree, i int) float64 {
+	env := ix.env
+	if ix.onEnvelope(i) {
+		env = ix.envelope(i)
+	}
+	minX, minY, maxX, maxY := trees[i].GetBoundingBox()
+	env = extendBounds(env, [4]float64{minX, minY, maxX, maxY})
+	return math.Max(env[2]-env[0], env[3]-env[1])
+}
+
+// envelope returns the union of all indexed bounding boxes except entry skip
+func (ix *Index) envelope(skip int) [4]float64 {
+	env := [4]float64{math.MaxFloat64, math.MaxFloat64, -math.MaxFloat64, -math.MaxFloat64}
+	for j, b := range ix.bounds {
+		if j != skip {
+			env = extendBounds(env, b)
+		}
+	}
+	return env
+}
+
+// onEnvelope reports whether the indexed box of entry i touches the envelope
+func (ix *Index) onEnvelope(i int) bool {
+	b := ix.bounds[i]
+	return b[0] <= ix.env[0] || b[1] <= ix.env[1] || b[2] >= ix.env[2] || b[3] >= ix.env[3]
+}
+
+// extendBounds returns the smallest box containing both env and b
+func extendBounds(env, b [4]float64) [4]float64 {
+	if b[0] < env[0] {
+		env[0] = b[0]
+	}
+	if b[1] < env[1] {
+		env[1] = b[1]
+	}
+	if b[2] > env[2] {
+		env[2] = b[2]
+	}
+	if b[3] > env[3] {
+		env[3] = b[3]
+	}
+	return env
+}
+
+// Collides checks if trees[i] overlaps any other tree. trees[i] may have moved
+// since it was last indexed; all other trees must be up to date.
+func (ix *Index) Collides(trees []ChristmasTree, i int) bool {
+	poly := trees[i].GetOrbPolygon()
+	minX, minY, maxX, maxY := ringBounds(poly[0])
+
+	// Converted lazily, only once a bounding-box neighbour is found
+	var geom polygol.Geom
+	collision := false
+	ix.tr.Search(
+		[2]float64{minX, minY},
+		[2]float64{maxX, maxY},
+		func(min, max [2]float64, data interface{}) bool {
+			j := data.(int)
+			if j == i {
+				return true
+			}
+			if geom == nil {
+				geom = orbPolygonToGeom(poly)
+			}
+			if geomsIntersect(geom, ix.geoms[j]) {
+				collision = true
+				return false // Stop searching
+			}
+			return true
+		},
+	)
+	return collision
+}
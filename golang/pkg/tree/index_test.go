@@ -0,0 +1,147 @@
+package tree
+
+import (
+	"math"
+	"math/rand"
+	"reflect"
+	"testing"
+
+	"github.com/engelsjk/polygol"
+)
+
+// gridTrees lays out n non-overlapping trees in rows of five
+func gridTrees(n int) []ChristmasTree {
+	trees := make([]ChristmasTree, n)
+	for k := range trees {
+		trees[k] = ChristmasTree{ID: k, X: float64(k%5) * 1.0, Y: float64(k/5) * 1.2}
+	}
+	return trees
+}
+
+// perturb moves trees[i] randomly and returns its previous state
+func perturb(rng *rand.Rand, trees []ChristmasTree, i int) ChristmasTree {
+	old := trees[i]
+	trees[i].X += rng.NormFloat64() * 0.3
+	trees[i].Y += rng.NormFloat64() * 0.3
+	trees[i].Angle = math.Mod(trees[i].Angle+rng.NormFloat64()*30+360, 360)
+	return old
+}
+
+func TestIndexCollidesMatchesHasOvl(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	trees := gridTrees(15)
+	ix := NewIndex(trees)
+
+	collisions, accepted := 0, 0
+	for step := 0; step < 5000; step++ {
+		i := rng.Intn(len(trees))
+		old := perturb(rng, trees, i)
+
+		got, want := ix.Collides(trees, i), HasOvl(trees, i)
+		if got != want {
+			t.Fatalf("step %d, tree %d: Collides = %v, HasOvl = %v", step, i, got, want)
+		}
+
+		// Accept like the collision-free SA does, so the index has to follow
+		// trees through Delete and re-Insert
+		if !got && rng.Float64() < 0.7 {
+			ix.Update(trees, i)
+			accepted++
+		} else {
+			trees[i] = old
+		}
+		if got {
+			collisions++
+		}
+	}
+
+	if collisions == 0 || accepted == 0 {
+		t.Fatalf("move sequence did not exercise both paths: %d collisions, %d accepted", collisions, accepted)
+	}
+}
+
+func TestIndexCollidesLeavesCachedGeomsUnchanged(t *testing.T) {
+	rng := rand.New(rand.NewSource(2))
+	trees := gridTrees(15)
+	ix := NewIndex(trees)
+
+	// Reference copies, converted independently of the cache
+	want := make([]polygol.Geom, len(trees))
+	for j := range trees {
+		want[j] = orbPolygonToGeom(trees[j].GetOrbPolygon())
+	}
+
+	// Query many moved positions without accepting any of them, so every
+	// intersection runs against the cached geometries
+	for step := 0; step < 2000; step++ {
+		i := rng.Intn(len(trees))
+		old := perturb(rng, trees, i)
+		ix.Collides(trees, i)
+		trees[i] = old
+	}
+
+	for j := range trees {
+		if !reflect.DeepEqual(ix.geoms[j], want[j]) {
+			t.Fatalf("cached geometry of tree %d was modified by Collides", j)
+		}
+	}
+}
+
+// envelopeTree returns the index of a tree whose bounding box lies on the
+// given side of the overall envelope (0: minX, 1: minY, 2: maxX, 3: maxY)
+func envelopeTree(trees []ChristmasTree, side int) int {
+	best, bestVal := 0, 0.0
+	for j := range trees {
+		minX, minY, maxX, maxY := trees[j].GetBoundingBox()
+		b := [4]float64{minX, minY, maxX, maxY}
+		v := b[side]
+		if side < 2 {
+			v = -v
+		}
+		if j == 0 || v > bestVal {
+			best, bestVal = j, v
+		}
+	}
+	return best
+}
+
+func TestIndexSideMatchesCalculateSideLength(t *testing.T) {
+	for _, n := range []int{1, 2, 25} {
+		rng := rand.New(rand.NewSource(int64(n)))
+		trees := gridTrees(n)
+		ix := NewIndex(trees)
+
+		for step := 0; step < 5000; step++ {
+			// Every other move takes a tree on the envelope, pulled towards the
+			// centre, so the envelope shrinks and Side/Update have to rescan
+			var i int
+			var old ChristmasTree
+			if step%2 == 0 {
+				i = envelopeTree(trees, rng.Intn(4))
+				minX, minY, maxX, maxY := GetBounds(trees)
+				old = perturb(rng, trees, i)
+				trees[i].X += ((minX+maxX)/2 - trees[i].X) * rng.Float64()
+				trees[i].Y += ((minY+maxY)/2 - trees[i].Y) * rng.Float64()
+			} else {
+				i = rng.Intn(n)
+				old = perturb(rng, trees, i)
+			}
+
+			if got, want := ix.Side(trees, i), CalculateSideLength(trees); got != want {
+				t.Fatalf("n=%d step %d: Side = %v, CalculateSideLength = %v", n, step, got, want)
+			}
+
+			if rng.Intn(2) == 0 {
+				ix.Update(trees, i)
+			} else {
+				trees[i] = old
+			}
+
+			// The envelope kept by Update must match a full recomputation too
+			j := rng.Intn(n)
+			if got, want := ix.Side(trees, j), CalculateSideLength(trees); got != want {
+				t.Fatalf("n=%d step %d: Side after update = %v, CalculateSideLength = %v", n, step, got, want)
+			}
+		}
+	}
+}
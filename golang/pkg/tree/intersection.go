@@ -4,17 +4,27 @@ import (
 	"math"
 
 	"github.com/engelsjk/polygol"
+	"github.com/paulmach/orb"
 )
 
 // Intersect checks if this tree intersects with another tree
 func (t *ChristmasTree) Intersect(other *ChristmasTree) bool {
-	poly1 := t.GetOrbPolygon()
-	poly2 := other.GetOrbPolygon()
+	return polygonsIntersect(t.GetOrbPolygon(), other.GetOrbPolygon())
+}
+
+// polygonsIntersect checks if two tree polygons overlap
+func polygonsIntersect(poly1, poly2 orb.Polygon) bool {
+	// Separated bounding boxes cannot intersect; skip the polygon clipping
+	if boundsDisjoint(poly1[0], poly2[0]) {
+		return false
+	}
 
 	// Convert orb.Polygon to polygol.Geom format
-	geom1 := orbPolygonToGeom(poly1)
-	geom2 := orbPolygonToGeom(poly2)
+	return geomsIntersect(orbPolygonToGeom(poly1), orbPolygonToGeom(poly2))
+}
 
+// geomsIntersect checks if two polygons already converted to polygol format overlap
+func geomsIntersect(geom1, geom2 polygol.Geom) bool {
 	// Use polygol to compute intersection
 	intersection, err := polygol.Intersection(geom1, geom2)
 	if err != nil {
@@ -32,6 +42,10 @@ func (t *ChristmasTree) IntersectionArea(other *ChristmasTree) float64 {
 	poly1 := t.GetOrbPolygon()
 	poly2 := other.GetOrbPolygon()
 
+	if boundsDisjoint(poly1[0], poly2[0]) {
+		return 0
+	}
+
 	geom1 := orbPolygonToGeom(poly1)
 	geom2 := orbPolygonToGeom(poly2)
 
@@ -50,6 +64,14 @@ func (t *ChristmasTree) IntersectionArea(other *ChristmasTree) float64 {
 	return totalArea
 }
 
+// boundsDisjoint reports whether the bounding boxes of two rings are strictly
+// separated along the x or y axis. Touching boxes are not considered disjoint.
+func boundsDisjoint(ring1, ring2 orb.Ring) bool {
+	minX1, minY1, maxX1, maxY1 := ringBounds(ring1)
+	minX2, minY2, maxX2, maxY2 := ringBounds(ring2)
+	return maxX1 < minX2 || maxX2 < minX1 || maxY1 < minY2 || maxY2 < minY1
+}
+
 // calculateRingArea calculates the area of a polygon ring using the shoelace formula
 func calculateRingArea(ring [][]float64) float64 {
 	n := len(ring)
@@ -9,12 +9,14 @@ func HasOvl(trees []ChristmasTree, i int) bool {
 	if i < 0 || i >= len(trees) {
 		return false
 	}
-	target := &trees[i]
+	// Build the target polygon once; each pair is bounding-box checked
+	// before any polygon clipping
+	target := trees[i].GetOrbPolygon()
 	for j := range trees {
 		if i == j {
 			continue
 		}
-		if target.Intersect(&trees[j]) {
+		if polygonsIntersect(target, trees[j].GetOrbPolygon()) {
 			return true
 		}
 	}
@@ -6,207 +6,216 @@ Displays Christmas trees from the sample_submission.csv file.
 import argparse
 import math
 import os
+from functools import lru_cache
 
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for headless rendering
-from decimal import Decimal, getcontext
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import shapely
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.patches import Rectangle
-from shapely import affinity
 from shapely.geometry import Polygon
-from shapely.ops import unary_union
 
 pd.set_option('display.float_format', '{:.12f}'.format)
 
-# Set precision for Decimal
-getcontext().prec = 25
-scale_factor = Decimal('1e15')
+# Coordinates are scaled up before being handed to shapely
+scale_factor = 1e15
+
+# Unrotated tree outline centred on the trunk top, in scaled coordinates
+BASE_VERTS = np.array(
+    [
+        # Start at Tip
+        (0.0, 0.8),
+        # Right side - Top Tier
+        (0.125, 0.5),
+        (0.0625, 0.5),
+        # Right side - Middle Tier
+        (0.2, 0.25),
+        (0.1, 0.25),
+        # Right side - Bottom Tier
+        (0.35, 0.0),
+        # Right Trunk
+        (0.075, 0.0),
+        (0.075, -0.2),
+        # Left Trunk
+        (-0.075, -0.2),
+        (-0.075, 0.0),
+        # Left side - Bottom Tier
+        (-0.35, 0.0),
+        # Left side - Middle Tier
+        (-0.1, 0.25),
+        (-0.2, 0.25),
+        # Left side - Top Tier
+        (-0.0625, 0.5),
+        (-0.125, 0.5),
+    ],
+    dtype=np.float64,
+) * scale_factor
+BASE_POLYGON = Polygon(BASE_VERTS)
 
 # Build the index of the submission, in the format:
 #  <trees_in_problem>_<tree_index>
 index = [f'{n:03d}_{t}' for n in range(1, 201) for t in range(n)]
 
 
+@lru_cache(maxsize=4096)
+def rotated_base_verts(angle: float) -> np.ndarray:
+    """
+    Return BASE_VERTS rotated by angle degrees about the origin.
+    Cached because layouts reuse a handful of angles; the array is shared,
+    so it is returned read-only.
+    """
+    rad = math.radians(angle)
+    c, s = math.cos(rad), math.sin(rad)
+    verts = BASE_VERTS @ np.array([[c, s], [-s, c]])
+    verts.flags.writeable = False
+    return verts
+
+
 class ChristmasTree:
     """Represents a single, rotatable Christmas tree of a fixed size."""
 
     def __init__(self, center_x='0', center_y='0', angle='0'):
         """Initializes the Christmas tree with a specific position and rotation."""
-        self.center_x = Decimal(center_x)
-        self.center_y = Decimal(center_y)
-        self.angle = Decimal(angle)
-
-        trunk_w = Decimal('0.15')
-        trunk_h = Decimal('0.2')
-        base_w = Decimal('0.7')
-        mid_w = Decimal('0.4')
-        top_w = Decimal('0.25')
-        tip_y = Decimal('0.8')
-        tier_1_y = Decimal('0.5')
-        tier_2_y = Decimal('0.25')
-        base_y = Decimal('0.0')
-        trunk_bottom_y = -trunk_h
-
-        initial_polygon = Polygon(
-            [
-                # Start at Tip
-                (Decimal('0.0') * scale_factor, tip_y * scale_factor),
-                # Right side - Top Tier
-                (top_w / Decimal('2') * scale_factor, tier_1_y * scale_factor),
-                (top_w / Decimal('4') * scale_factor, tier_1_y * scale_factor),
-                # Right side - Middle Tier
-                (mid_w / Decimal('2') * scale_factor, tier_2_y * scale_factor),
-                (mid_w / Decimal('4') * scale_factor, tier_2_y * scale_factor),
-                # Right side - Bottom Tier
-                (base_w / Decimal('2') * scale_factor, base_y * scale_factor),
-                # Right Trunk
-                (trunk_w / Decimal('2') * scale_factor, base_y * scale_factor),
-                (trunk_w / Decimal('2') * scale_factor, trunk_bottom_y * scale_factor),
-                # Left Trunk
-                (-(trunk_w / Decimal('2')) * scale_factor, trunk_bottom_y * scale_factor),
-                (-(trunk_w / Decimal('2')) * scale_factor, base_y * scale_factor),
-                # Left side - Bottom Tier
-                (-(base_w / Decimal('2')) * scale_factor, base_y * scale_factor),
-                # Left side - Middle Tier
-                (-(mid_w / Decimal('4')) * scale_factor, tier_2_y * scale_factor),
-                (-(mid_w / Decimal('2')) * scale_factor, tier_2_y * scale_factor),
-                # Left side - Top Tier
-                (-(top_w / Decimal('4')) * scale_factor, tier_1_y * scale_factor),
-                (-(top_w / Decimal('2')) * scale_factor, tier_1_y * scale_factor),
-            ]
-        )
-        rotated = affinity.rotate(initial_polygon, float(self.angle), origin=(0, 0))
-        self.polygon = affinity.translate(rotated,
-                                          xoff=float(self.center_x * scale_factor),
-                                          yoff=float(self.center_y * scale_factor))
-
-
-def load_submission(filepath: str, num_trees: int) -> pd.DataFrame:
+        self.center_x = float(center_x)
+        self.center_y = float(center_y)
+        self.angle = float(angle)
+
+        if self.center_x == 0 and self.center_y == 0 and self.angle == 0:
+            # Polygons are immutable, so untransformed trees can share one
+            self.polygon = BASE_POLYGON
+            return
+
+        offset = np.array([self.center_x, self.center_y]) * scale_factor
+        self.polygon = Polygon(rotated_base_verts(self.angle) + offset)
+
+
+def build_all(xs, ys, degs) -> np.ndarray:
     """
-    Load and process the sample submission for a specific number of trees.
-    Returns a DataFrame with x, y, deg columns (without 's' prefix).
+    Build the polygons for many trees at once.
+    Equivalent to [ChristmasTree(x, y, deg).polygon ...] but rotates all
+    vertex templates in one matmul and creates the polygons in one call.
     """
-    df = pd.read_csv(filepath, index_col='id')
-    
-    # Filter for the specific tree count
-    prefix = f"{num_trees:03d}_"
-    mask = df.index.str.startswith(prefix)
-    subset = df[mask].copy()
-    
-    # Remove 's' prefix and convert to float
-    for col in ['x', 'y', 'deg']:
-        subset[col] = subset[col].str.replace('s', '').astype(str)
-    
-    return subset
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    rad = np.radians(np.asarray(degs, dtype=np.float64))
+    c, s = np.cos(rad), np.sin(rad)
 
+    rotations = np.stack([np.stack([c, s], axis=-1), np.stack([-s, c], axis=-1)], axis=-2)
+    offsets = np.stack([xs, ys], axis=-1)[:, np.newaxis, :] * scale_factor
+    return shapely.polygons(BASE_VERTS @ rotations + offsets)
 
-def get_bounding_side_length(num_trees: int, submission_path: str) -> Decimal:
-    """Calculate the bounding square side length for a given number of trees."""
-    df = load_submission(submission_path, num_trees)
-    
-    if df.empty:
-        return Decimal('0')
-    
-    placed_trees = []
-    for _, row in df.iterrows():
-        tree = ChristmasTree(
-            center_x=row['x'],
-            center_y=row['y'],
-            angle=row['deg']
-        )
-        placed_trees.append(tree)
-    
-    all_polygons = [t.polygon for t in placed_trees]
-    bounds = unary_union(all_polygons).bounds
-    
-    minx = Decimal(bounds[0]) / scale_factor
-    miny = Decimal(bounds[1]) / scale_factor
-    maxx = Decimal(bounds[2]) / scale_factor
-    maxy = Decimal(bounds[3]) / scale_factor
 
-    width = maxx - minx
-    height = maxy - miny
-    side_length = max(width, height)
+def load_submission(filepath: str) -> pd.DataFrame:
+    """
+    Load and process a submission file.
+    Returns a DataFrame with x, y, deg columns (without 's' prefix) and the
+    number of trees in each row's problem as n.
+    """
+    df = pd.read_csv(filepath, index_col='id')
+
+    # Rows whose id has no numeric problem prefix belong to no problem; skip them
+    n = pd.to_numeric(df.index.str.split('_').str[0], errors='coerce').to_numpy(dtype=float)
+    valid_id = np.isfinite(n)
+    if not valid_id.all():
+        print(f"Skipping {(~valid_id).sum()} rows with malformed ids in {filepath}")
+    df = df[valid_id].copy()
+    df['n'] = n[valid_id].astype(int)
+    
+    # Remove the leading 's' from every value and convert to float; values
+    # without the prefix or otherwise malformed become NaN, so only their own
+    # problem is reported as an error
+    cols = ['x', 'y', 'deg']
+    df[cols] = df[cols].apply(
+        lambda col: pd.to_numeric(col.str[1:].where(col.str[0] == 's'), errors='coerce')
+    )
     
-    return side_length
+    return df
 
 
-def calculate_scores(submission_path: str, max_trees: int = 200) -> list:
+def calculate_scores(submission: pd.DataFrame, max_trees: int = 200) -> list:
     """
     Calculate scores for each tree count.
     Score = x² / n where x is bounding square edge length, n is number of trees.
     Returns list of (n, side_length, score) tuples.
     """
+    df = submission[submission['n'] <= max_trees].sort_values('n', kind='stable')
+
+    # Problems with unparseable values are reported as errors and left out of the total
+    finite = np.isfinite(df[['x', 'y', 'deg']].to_numpy()).all(axis=1)
+    error_ns = set(df.loc[~finite, 'n'].tolist())
+    df = df[~df['n'].isin(error_ns)]
+
+    polygons = build_all(df['x'], df['y'], df['deg'])
+    bounds = shapely.bounds(polygons) / scale_factor
+
+    # Rows are sorted by n, so each problem is one contiguous block of bounds
+    n_values, starts = np.unique(df['n'].to_numpy(), return_index=True)
+    minx = np.minimum.reduceat(bounds[:, 0], starts)
+    miny = np.minimum.reduceat(bounds[:, 1], starts)
+    maxx = np.maximum.reduceat(bounds[:, 2], starts)
+    maxy = np.maximum.reduceat(bounds[:, 3], starts)
+    side_lengths = np.maximum(maxx - minx, maxy - miny)
+    scores = side_lengths * side_lengths / n_values
+    rows = dict(zip(n_values.tolist(), zip(side_lengths.tolist(), scores.tolist())))
+
     results = []
-    total_score = Decimal('0')
-    
+    total_score = 0.0
+
     print("\n" + "=" * 70)
     print(f"{'N':>5} │ {'Side Length':>18} │ {'Score (x²/n)':>18}")
     print("─" * 70)
-    
-    for n in range(1, max_trees + 1):
-        try:
-            side_length = get_bounding_side_length(n, submission_path)
-            if side_length > 0:
-                score = (side_length * side_length) / Decimal(n)
-                total_score += score
-                results.append((n, side_length, score))
-                print(f"{n:>5} │ {float(side_length):>18.12f} │ {float(score):>18.12f}")
-        except Exception as e:
-            print(f"{n:>5} │ {'ERROR':>18} │ {str(e)[:18]}")
-    
+
+    for n in sorted(rows.keys() | error_ns):
+        if n in error_ns:
+            print(f"{n:>5} │ {'ERROR':>18} │ {'invalid values':>18}")
+            continue
+        side_length, score = rows[n]
+        if side_length > 0:
+            total_score += score
+            results.append((n, side_length, score))
+            print(f"{n:>5} │ {side_length:>18.12f} │ {score:>18.12f}")
+
     print("─" * 70)
-    print(f"{'TOTAL':>5} │ {'-':>18} │ {float(total_score):>18.12f}")
+    print(f"{'TOTAL':>5} │ {'-':>18} │ {total_score:>18.12f}")
     print("=" * 70 + "\n")
-    
+
     return results, total_score
 
 
-def plot_trees(num_trees: int, submission_path: str):
+def plot_trees(num_trees: int, df: pd.DataFrame):
     """Plot the tree arrangement for a given number of trees."""
-    # Load submission data
-    df = load_submission(submission_path, num_trees)
-    
-    if df.empty:
-        print(f"No data found for {num_trees} trees")
-        return
-    
+    if not np.isfinite(df[['x', 'y', 'deg']].to_numpy()).all():
+        raise ValueError(f"invalid x/y/deg values for {num_trees} trees")
+
     # Create figure
     fig, ax = plt.subplots(figsize=(10, 10))
     colors = plt.cm.viridis(np.linspace(0, 1, len(df)))
     
     placed_trees = []
     
-    for i, (idx, row) in enumerate(df.iterrows()):
+    for cx, cy, deg in zip(df['x'].to_numpy(), df['y'].to_numpy(), df['deg'].to_numpy()):
         # Create tree using the proper ChristmasTree class
-        tree = ChristmasTree(
-            center_x=row['x'],
-            center_y=row['y'],
-            angle=row['deg']
-        )
-        placed_trees.append(tree)
+        placed_trees.append(ChristmasTree(center_x=cx, center_y=cy, angle=deg))
     
     # Get bounding box
-    all_polygons = [t.polygon for t in placed_trees]
-    bounds = unary_union(all_polygons).bounds
+    all_polygons = np.asarray([t.polygon for t in placed_trees], dtype=object)
+    bounds = shapely.bounds(all_polygons)
+    minx, miny = bounds[:, :2].min(axis=0) / scale_factor
+    maxx, maxy = bounds[:, 2:].max(axis=0) / scale_factor
     
-    # Plot each tree
-    for i, tree in enumerate(placed_trees):
-        # Rescale for plotting
-        x_scaled, y_scaled = tree.polygon.exterior.xy
-        x = [Decimal(val) / scale_factor for val in x_scaled]
-        y = [Decimal(val) / scale_factor for val in y_scaled]
-        ax.plot(x, y, color=colors[i])
-        ax.fill(x, y, alpha=0.5, color=colors[i])
+    # Plot all trees as two collections, rescaled for plotting: the translucent
+    # fills first, then every outline above all of them (as ax.fill/ax.plot did)
+    coords, tree_idx = shapely.get_coordinates(all_polygons, return_index=True)
+    verts = np.split(coords / scale_factor, np.flatnonzero(np.diff(tree_idx)) + 1)
+    translucent = colors.copy()
+    translucent[:, 3] = 0.5
+    ax.add_collection(PolyCollection(verts, facecolors=translucent, edgecolors=translucent, linewidths=1.0, joinstyle='miter'))
+    ax.add_collection(LineCollection(verts, colors=colors, linewidths=1.5, capstyle='projecting', joinstyle='round', zorder=2))
     
-    minx = Decimal(bounds[0]) / scale_factor
-    miny = Decimal(bounds[1]) / scale_factor
-    maxx = Decimal(bounds[2]) / scale_factor
-    maxy = Decimal(bounds[3]) / scale_factor
-
     width = maxx - minx
     height = maxy - miny
     side_length = max(width, height)
@@ -215,9 +224,9 @@ def plot_trees(num_trees: int, submission_path: str):
     square_y = miny if height >= width else miny - (side_length - height) / 2
     
     bounding_square = Rectangle(
-        (float(square_x), float(square_y)),
-        float(side_length),
-        float(side_length),
+        (square_x, square_y),
+        side_length,
+        side_length,
         fill=False,
         edgecolor='red',
         linewidth=2,
@@ -225,13 +234,9 @@ def plot_trees(num_trees: int, submission_path: str):
     )
     ax.add_patch(bounding_square)
 
-    padding = Decimal('0.5')
-    ax.set_xlim(
-        float(square_x - padding),
-        float(square_x + side_length + padding))
-    ax.set_ylim(
-        float(square_y - padding),
-        float(square_y + side_length + padding))
+    padding = 0.5
+    ax.set_xlim(square_x - padding, square_x + side_length + padding)
+    ax.set_ylim(square_y - padding, square_y + side_length + padding)
     ax.set_aspect('equal', adjustable='box')
     ax.axis('off')
     plt.title(f'{num_trees} Trees: {side_length:.12f}')
@@ -287,19 +292,24 @@ def main():
                         help='Maximum number of trees to score (default: 200)')
     args = parser.parse_args()
     
-    submission_path = args.output
+    # Read the submission once and share it between scoring and plotting
+    submission = load_submission(args.output)
     
     if args.score:
         # Calculate and display scores
-        results, total = calculate_scores(submission_path, args.max_n)
+        results, total = calculate_scores(submission, args.max_n)
         plot_scores(results)
     
     tree_counts = args.trees
+    problems = dict(list(submission.groupby('n')))
     
     for n in tree_counts:
+        if n not in problems:
+            print(f"No data found for {n} trees")
+            continue
         print(f"Plotting {n} trees...")
         try:
-            plot_trees(n, submission_path)
+            plot_trees(n, problems[n])
         except Exception as e:
             print(f"Error plotting {n} trees: {e}")
             import traceback